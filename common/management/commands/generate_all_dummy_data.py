@@ -1,19 +1,34 @@
 import logging
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Type, List, Dict, Any
+from typing import Type, List, Dict, Any, Callable, Tuple, Iterator, Optional
 
+import django
+import numpy as np
 from django.apps import apps
-from django.core.management.base import BaseCommand
-from django.db import models, transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, IntegrityError, connection, connections, models, transaction
 from django.db.models.fields import Field
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.contrib.auth.models import User, Group
 from django.utils import timezone
 from faker import Faker
 
+try:
+    from psycopg2.extras import execute_values
+except ImportError:
+    execute_values = None
+
 logger = logging.getLogger(__name__)
-fake = Faker()
+# Upper bound of values passed in one INSERT statement
+BULK_INSERT_MAX_PARAMS = 2000
+# Models with at least this number of fields are inserted with raw SQL
+# on PostgreSQL (psycopg2) to avoid the bulk_create() overhead
+RAW_INSERT_MIN_FIELDS = 20
 
 class Command(BaseCommand):
     help = 'Generates 100 dummy records for all models in the application'
@@ -21,8 +36,15 @@ class Command(BaseCommand):
     def __init__(self):
         super().__init__()
         self.created_objects: Dict[str, List[Any]] = {}
+        self.created_pks: Dict[str, List[Any]] = {}
         self.processed_models = set()
         self.skipped_models = set()
+        self._fk_pk_cache: Dict[str, list] = {}
+        self._plan_cache: Dict[Type, List[Tuple[str, Callable[[], Any]]]] = {}
+        self._label: Dict[Type, str] = {}
+        self._dependencies: Dict[Type, Dict[Type, bool]] = {}
+        self._levels: List[List[Type]] = []
+        self._empty_models = set()
         self.faker = Faker(['en_US'])  # Initialize with specific locale
 
     def add_arguments(self, parser):
@@ -32,9 +54,22 @@ class Command(BaseCommand):
             type=str,
             help='Models to exclude (format: app_label.model_name)'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Number of worker processes (defaults to the number of CPUs)'
+        )
 
     def handle(self, *args, **options):
-        excluded_models = options.get('exclude', [])
+        excluded_models = options.get('exclude') or []
+        workers = options.get('workers')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise CommandError('--workers must be at least 1')
+        if connection.vendor == 'sqlite':
+            # SQLite allows only one writer at a time
+            workers = 1
         
         try:
             # Create base auth models first
@@ -46,25 +81,39 @@ class Command(BaseCommand):
             # Filter out excluded models and auth models
             models_to_process = [
                 model for model in all_models 
-                if (f"{model._meta.app_label}.{model._meta.model_name}" not in excluded_models and
+                if (self.get_label(model) not in excluded_models and
                     model._meta.app_label != 'auth')
             ]
 
             # Sort models by dependencies
-            sorted_models = self.sort_models_by_dependencies(models_to_process)
+            self.sort_models_by_dependencies(models_to_process)
 
-            # Process each model without transaction to avoid rollback on error
-            for model in sorted_models:
-                try:
-                    self.generate_data_for_model(model)
-                    # Handle M2M relations after successful creation
-                    self.handle_many_to_many_relations(model)
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'Error processing {model._meta.label}: {str(e)}'
+            # Process each model without transaction to avoid rollback on error.
+            # Models of the same dependency level don't refer to each other,
+            # so they can be generated concurrently.
+            for level in self._levels:
+                if workers > 1 and len(level) > 1:
+                    self.generate_data_in_workers(level, workers)
+                else:
+                    for model in level:
+                        try:
+                            self.generate_data_for_model(model)
+                        except Exception as e:
+                            self.stdout.write(
+                                self.style.WARNING(
+                                    f'Error processing {model._meta.label}: {str(e)}'
+                                )
+                            )
+                # Handle M2M relations after successful creation
+                for model in level:
+                    try:
+                        self.handle_many_to_many_relations(model)
+                    except Exception as e:
+                        self.stdout.write(
+                            self.style.WARNING(
+                                f'Error processing {model._meta.label}: {str(e)}'
+                            )
                         )
-                    )
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -85,26 +134,149 @@ class Command(BaseCommand):
                 self.style.ERROR(f'Failed to generate dummy data: {str(e)}')
             )
 
+    def get_label(self, model: Type[models.Model]) -> str:
+        """Return the cached "app_label.model_name" string of a model."""
+        label = self._label.get(model)
+        if label is None:
+            label = f"{model._meta.app_label}.{model._meta.model_name}"
+            self._label[model] = label
+        return label
+
+    def sort_models_by_dependencies(
+            self, models_list: List[Type[models.Model]]
+    ) -> List[Type[models.Model]]:
+        """
+        Sort models so that the targets of foreign keys are generated
+        before the models referring to them. Cycles of nullable FKs are
+        broken one model at a time; models in cycles of required FKs
+        keep their original order at the end of the list.
+        The models are also grouped into dependency levels. Models of one
+        level don't share a table (e.g. proxies), so that they can be
+        generated concurrently and each one can re-read its own rows.
+        """
+        self._dependencies = {}
+        self._levels = []
+        for model in models_list:
+            self.get_label(model)
+            dependencies = {}
+            for field in model._meta.fields:
+                if not isinstance(field, ForeignKey):
+                    continue
+                related_model = field.remote_field.model
+                if related_model is model or related_model not in models_list:
+                    continue
+                dependencies[related_model] = (
+                    dependencies.get(related_model, False) or not field.null
+                )
+            self._dependencies[model] = dependencies
+
+        sorted_models = []
+        done = set()
+        remaining = list(models_list)
+        while remaining:
+            ready = []
+            tables = set()
+            for model in remaining:
+                concrete_model = model._meta.concrete_model
+                if (done.issuperset(self._dependencies[model])
+                        and concrete_model not in tables):
+                    ready.append(model)
+                    tables.add(concrete_model)
+            if not ready:
+                # Break a cycle of nullable FKs with one model
+                # whose required FK targets are already generated
+                ready = [
+                    model for model in remaining
+                    if all(
+                        dep in done
+                        for dep, required in self._dependencies[model].items()
+                        if required
+                    )
+                ][:1]
+            if not ready:
+                # Required FKs form a cycle
+                sorted_models.extend(remaining)
+                self._levels.extend([model] for model in remaining)
+                break
+            sorted_models.extend(ready)
+            self._levels.append(ready)
+            done.update(ready)
+            remaining = [model for model in remaining if model not in done]
+        return sorted_models
+
+    def generate_data_in_workers(self, level: List[Type[models.Model]],
+                                 workers: int) -> None:
+        """Generate data for independent models in separate processes."""
+        labels = [self.get_label(model) for model in level]
+        dependencies = [
+            {
+                self.get_label(dependency): required
+                for dependency, required in self._dependencies.get(model, {}).items()
+            }
+            for model in level
+        ]
+        # Each worker process has to open its own database connection
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=min(workers, len(level))) as executor:
+            futures = [
+                executor.submit(
+                    generate_model_data, label, model_dependencies,
+                    self.created_pks, self._empty_models
+                )
+                for label, model_dependencies in zip(labels, dependencies)
+            ]
+            for model, label, future in zip(level, labels, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f'Error processing {model._meta.label}: {str(e)}'
+                        )
+                    )
+                    self.skipped_models.add(label)
+                    self._empty_models.add(label)
+                    continue
+                if result['created_objects'] is not None:
+                    self.created_objects[label] = result['created_objects']
+                    self.created_pks[label] = [
+                        obj.pk for obj in result['created_objects']
+                    ]
+                    self._fk_pk_cache.pop(label, None)
+                if result['processed']:
+                    self.processed_models.add(label)
+                if result['empty']:
+                    self._empty_models.add(label)
+                self.skipped_models.update(result['skipped'])
+
     def create_base_auth_models(self):
         """Create necessary auth models first"""
         try:
-            # Create groups
             groups = ['managers', 'operators', 'superoperators']
-            for group_name in groups:
-                Group.objects.get_or_create(name=group_name)
-
-            # Create superuser if doesn't exist
-            if not User.objects.filter(is_superuser=True).exists():
-                User.objects.create_superuser(
-                    'admin', 'admin@example.com', 'admin'
+            with transaction.atomic():
+                # Create groups in one query, existing ones are left as is
+                Group.objects.bulk_create(
+                    [Group(name=group_name) for group_name in groups],
+                    ignore_conflicts=True
                 )
 
+                # Create superuser if doesn't exist. A savepoint keeps
+                # the groups if the superuser can't be created.
+                if not User.objects.filter(is_superuser=True).exists():
+                    try:
+                        with transaction.atomic():
+                            User.objects.create_superuser(
+                                'admin', 'admin@example.com', 'admin'
+                            )
+                    except Exception as e:
+                        logger.error(f'Error creating superuser: {str(e)}')
+
         except Exception as e:
             logger.error(f'Error creating base auth models: {str(e)}')
 
     def generate_data_for_model(self, model: Type[models.Model]) -> None:
         """Generate dummy data for a specific model."""
-        model_name = f"{model._meta.app_label}.{model._meta.model_name}"
+        model_name = self.get_label(model)
         
         try:
             self.stdout.write(f'Generating data for {model_name}...')
@@ -112,126 +284,381 @@ class Command(BaseCommand):
             # Skip abstract models
             if model._meta.abstract:
                 self.skipped_models.add(f"{model_name} (abstract)")
+                self._empty_models.add(model_name)
                 return
 
-            # Create objects one by one to handle errors
+            # Skip models whose required FK targets got no rows
+            for dependency, required in self._dependencies.get(model, {}).items():
+                dependency_name = self.get_label(dependency)
+                if required and dependency_name in self._empty_models:
+                    self.skipped_models.add(
+                        f"{model_name} (no {dependency_name} records)"
+                    )
+                    self._empty_models.add(model_name)
+                    return
+
+            # Insert rows in batches instead of one INSERT per object.
+            # Instances are generated lazily, one batch at a time.
+            instances = self.iter_model_instances(model, 100)
+            batch_size = self.get_batch_size(model)
             created_objects = []
-            for i in range(100):
-                try:
-                    obj = self.create_model_instance(model)
-                    if obj:
-                        obj.save()
-                        created_objects.append(obj)
-                except Exception as e:
-                    logger.error(f'Error creating instance {i} of {model_name}: {str(e)}')
-                    continue
-                
-            self.processed_models.add(model_name)
+            insert_raw = self.can_insert_raw(model)
+            # bulk_create() doesn't support multi-table inheritance
+            multi_table = bool(model._meta.concrete_model._meta.parents)
+            # Primary keys are not set on objects when conflicts are
+            # ignored, so the rows after the current last pk are re-read
+            last_pk = model._default_manager.aggregate(
+                last_pk=models.Max('pk')
+            )['last_pk']
+            with self.bulk_transaction():
+                while batch := list(islice(instances, batch_size)):
+                    if multi_table:
+                        for obj in batch:
+                            # A savepoint per row, so that a conflicting row
+                            # is skipped like with ignore_conflicts
+                            try:
+                                with transaction.atomic():
+                                    obj.save()
+                            except IntegrityError:
+                                continue
+                            created_objects.append(obj)
+                    elif insert_raw:
+                        pks = self.bulk_insert_raw(model, batch)
+                        if len(pks) == len(batch):
+                            for obj, pk in zip(batch, pks):
+                                obj.pk = pk
+                        created_objects.extend(batch)
+                    else:
+                        created_objects.extend(
+                            model._default_manager.bulk_create(
+                                batch, ignore_conflicts=True
+                            )
+                        )
+            if any(obj.pk is None for obj in created_objects):
+                queryset = model._default_manager.order_by('pk')
+                if last_pk is not None:
+                    queryset = queryset.filter(pk__gt=last_pk)
+                created_objects = list(queryset)
+
             self.created_objects[model_name] = created_objects
+            self.created_pks[model_name] = [obj.pk for obj in created_objects]
+            self._fk_pk_cache.pop(model_name, None)
+            if created_objects:
+                self.processed_models.add(model_name)
+            else:
+                # e.g. SQLite's INSERT OR IGNORE also drops NOT NULL failures
+                self.skipped_models.add(f"{model_name} (no rows inserted)")
+                self._empty_models.add(model_name)
             
         except Exception as e:
             logger.error(f'Error generating data for {model_name}: {str(e)}')
             self.skipped_models.add(model_name)
+            try:
+                has_rows = model._default_manager.exists()
+            except Exception:
+                has_rows = False
+            if not has_rows:
+                self._empty_models.add(model_name)
 
-    def generate_field_value(self, field: Field) -> Any:
-        """Generate appropriate dummy value for a given field."""
-        try:
-            if isinstance(field, models.CharField):
-                max_length = field.max_length or 100
-                
-                if field.name.lower().endswith('email'):
-                    return self.faker.email()
-                elif field.name.lower().endswith('phone'):
-                    return self.faker.phone_number()[:max_length]
-                elif field.name.lower().endswith('name'):
-                    return self.faker.name()[:max_length]
-                elif field.name.lower() == 'language_code':
-                    return 'en'
-                else:
-                    return self.faker.text(max_length)[:max_length]
-                
-            elif isinstance(field, models.TextField):
-                return self.faker.text()
-                
-            elif isinstance(field, models.DateTimeField):
-                if field.name in ['created', 'modified', 'creation_date']:
-                    return timezone.now()
-                return self.faker.date_time_this_decade(tzinfo=timezone.get_current_timezone())
-                
-            elif isinstance(field, models.DateField):
-                if field.name in ['created', 'modified', 'creation_date']:
-                    return timezone.now().date()
-                return self.faker.date_this_decade()
-                
-            elif isinstance(field, models.BooleanField):
-                return self.faker.boolean()
-                
-            elif isinstance(field, (models.IntegerField, models.SmallIntegerField)):
-                if field.name == 'index_number':
-                    return random.randint(1, 100)
-                return self.faker.random_int(min=0, max=1000)
-                
-            elif isinstance(field, models.DecimalField):
-                return self.faker.pydecimal(
-                    left_digits=field.max_digits - field.decimal_places,
-                    right_digits=field.decimal_places,
-                    positive=True
+    def get_value_factory(self, field: Field) -> Optional[Callable[[], Any]]:
+        """
+        Return a zero-argument callable producing dummy values for a field
+        or None if the field type is not supported.
+        """
+        # Only valid choices can be displayed by the admin and reports
+        if field.choices and not field.is_relation:
+            values = [choice[0] for choice in field.flatchoices]
+            return lambda: random.choice(values)
+
+        # EmailField and URLField are CharField subclasses,
+        # so they have to be checked first
+        elif isinstance(field, models.EmailField):
+            return self.pooled(self.faker.email)
+
+        elif isinstance(field, models.URLField):
+            urls = [self.faker.url() for _ in range(20)]
+            return lambda: random.choice(urls)
+
+        elif isinstance(field, models.CharField):
+            max_length = field.max_length or 100
+            # Classify the field by name once, not for every row
+            lname = field.name.lower()
+
+            if lname.endswith('email'):
+                return self.pooled(self.faker.email)
+            elif lname.endswith('phone'):
+                return self.pooled(lambda: self.faker.phone_number()[:max_length])
+            elif lname.endswith('name'):
+                return self.pooled(lambda: self.faker.name()[:max_length])
+            elif lname == 'language_code':
+                return lambda: 'en'
+            elif max_length < 64:
+                # text() is costly for short strings and needs max_length >= 5
+                return self.pooled(
+                    lambda: self.faker.pystr(min_chars=1, max_chars=max_length)
                 )
-                
-            elif isinstance(field, models.URLField):
-                return self.faker.url()
-                
-            elif isinstance(field, ForeignKey):
-                related_model = field.remote_field.model
-                related_model_name = f"{related_model._meta.app_label}.{related_model._meta.model_name}"
-                
-                # Try to get from created objects first
-                related_objects = self.created_objects.get(related_model_name, [])
-                if related_objects:
-                    return random.choice(related_objects)
-                
-                # Try to get from database
-                try:
-                    return related_model.objects.order_by('?').first()
-                except Exception:
-                    return None
-                
-            elif isinstance(field, models.EmailField):
-                return self.faker.email()
-                
-        except Exception as e:
-            logger.error(f'Error generating value for field {field.name}: {str(e)}')
-            return None
-            
+            else:
+                return self.pooled(lambda: self.faker.text(max_length))
+
+        elif isinstance(field, models.TextField):
+            return self.pooled(self.faker.text)
+
+        elif isinstance(field, models.DateTimeField):
+            if field.name in ['created', 'modified', 'creation_date']:
+                return timezone.now
+            tzinfo = timezone.get_current_timezone()
+            return self.pooled(
+                lambda: self.faker.date_time_this_decade(tzinfo=tzinfo)
+            )
+
+        elif isinstance(field, models.DateField):
+            if field.name in ['created', 'modified', 'creation_date']:
+                return lambda: timezone.now().date()
+            return self.pooled(self.faker.date_this_decade)
+
+        elif isinstance(field, models.BooleanField):
+            return lambda: bool(random.getrandbits(1))
+
+        elif isinstance(field, (models.IntegerField, models.SmallIntegerField)):
+            if field.name == 'index_number':
+                return lambda: random.randint(1, 100)
+            return lambda: random.randint(0, 1000)
+
+        elif isinstance(field, models.DecimalField):
+            left_digits = field.max_digits - field.decimal_places
+            right_digits = field.decimal_places
+            return self.pooled(lambda: self.faker.pydecimal(
+                left_digits=left_digits,
+                right_digits=right_digits,
+                positive=True
+            ))
+
+        elif isinstance(field, ForeignKey):
+            related_model = field.remote_field.model
+            related_model_name = self.get_label(related_model)
+            return lambda: self.get_related_pk(related_model, related_model_name)
+
         return None
 
+    @staticmethod
+    def pooled(generate: Callable[[], Any], size: int = 100) -> Callable[[], Any]:
+        """
+        Wrap a value generator so that values are produced in batches
+        of `size` and handed out one at a time from the pool.
+        """
+        pool = []
+
+        def pop() -> Any:
+            if not pool:
+                pool.extend([generate() for _ in range(size)])
+            return pool.pop()
+
+        return pop
+
+    def get_related_pk(self, related_model: Type[models.Model],
+                       related_model_name: str) -> Any:
+        """Return a random primary key of the related model."""
+        # Try to get from created objects first
+        related_pks = self.created_pks.get(related_model_name)
+        if related_pks:
+            return random.choice(related_pks)
+
+        # Models that failed or produced no rows are not looked up again
+        if related_model_name in self._empty_models:
+            return None
+
+        # Fall back to primary keys already stored in the database.
+        # They are read once per related model and sampled in Python
+        # instead of sorting the whole table with order_by('?').
+        pks = self._fk_pk_cache.get(related_model_name)
+        if pks is None:
+            try:
+                pks = list(
+                    related_model._default_manager.values_list(
+                        'pk', flat=True
+                    )[:1000]
+                )
+            except DatabaseError:
+                pks = []
+            self._fk_pk_cache[related_model_name] = pks
+        return random.choice(pks) if pks else None
+
+    def get_model_plan(self, model: Type[models.Model]) -> List[Tuple[str, Callable[[], Any]]]:
+        """
+        Return (attname, value factory) pairs for the model fields.
+        The plan is built once per model, so the field type dispatch
+        is not repeated for every generated row.
+        """
+        plan = self._plan_cache.get(model)
+        if plan is None:
+            plan = []
+            for field in model._meta.fields:
+                if field.name in ('id', 'pk') or isinstance(field, models.AutoField):
+                    continue
+                if field.remote_field and field.remote_field.parent_link:
+                    # The link to the parent row is set when it is saved
+                    continue
+                # Fields are validated here, so that generating the rows
+                # doesn't need any error handling
+                try:
+                    factory = self.get_value_factory(field)
+                    if factory is None:
+                        # Unsupported field, leave its default value
+                        logger.debug(f'Unsupported field {model._meta.label}.{field.name}')
+                        continue
+                    factory()
+                except Exception as e:
+                    logger.error(f'Error generating value for field {field.name}: {str(e)}')
+                    continue
+                # FK values are primary keys, so use the "<name>_id" attribute
+                # and bypass the related object descriptor
+                plan.append((field.attname, factory))
+            self._plan_cache[model] = plan
+        return plan
+
+    @staticmethod
+    @contextmanager
+    def bulk_transaction():
+        """
+        Run a block in one transaction. On PostgreSQL the commit doesn't
+        wait for the WAL flush, durability isn't needed for dummy data.
+        """
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+            yield
+
+    @staticmethod
+    def can_insert_raw(model: Type[models.Model]) -> bool:
+        """Check if rows of the model can be inserted bypassing the ORM."""
+        return (
+            execute_values is not None
+            and connection.vendor == 'postgresql'
+            and connection.Database.__name__ == 'psycopg2'
+            # multi-table inheritance needs inserts into several tables
+            and not model._meta.concrete_model._meta.parents
+            and len(model._meta.fields) >= RAW_INSERT_MIN_FIELDS
+        )
+
+    @staticmethod
+    def bulk_insert_raw(model: Type[models.Model],
+                        objs: List[models.Model]) -> List[Any]:
+        """
+        Insert objects with a multi-row INSERT built by psycopg2
+        execute_values(). Rows conflicting with existing ones are skipped.
+        Returns primary keys of the inserted rows.
+        """
+        opts = model._meta
+        fields = [
+            field for field in opts.concrete_fields
+            if not isinstance(field, models.AutoField)
+        ]
+        qn = connection.ops.quote_name
+        rows = [
+            tuple(
+                field.get_db_prep_save(field.pre_save(obj, True), connection)
+                for field in fields
+            )
+            for obj in objs
+        ]
+        columns = ', '.join(qn(field.column) for field in fields)
+        sql = (
+            f"INSERT INTO {qn(opts.db_table)} ({columns}) VALUES %s "
+            f"ON CONFLICT DO NOTHING RETURNING {qn(opts.pk.column)}"
+        )
+        with connection.cursor() as cursor:
+            result = execute_values(
+                cursor.cursor, sql, rows, page_size=1000, fetch=True
+            )
+        return [row[0] for row in result]
+
+    @staticmethod
+    def get_batch_size(model: Type[models.Model]) -> int:
+        """
+        Return the number of rows inserted per query, so that wide
+        models don't exceed the query parameter limits of the backend.
+        """
+        return max(1, BULK_INSERT_MAX_PARAMS // max(1, len(model._meta.fields)))
+
+    def iter_model_instances(self, model: Type[models.Model],
+                             count: int) -> Iterator[models.Model]:
+        """Yield `count` unsaved instances of a model."""
+        for _ in range(count):
+            yield self.create_model_instance(model)
+
     def create_model_instance(self, model: Type[models.Model]) -> models.Model:
         """Create a single instance of a model with dummy data."""
         instance = model()
         
-        for field in model._meta.fields:
-            if field.name in ('id', 'pk'):
-                continue
-                
-            value = self.generate_field_value(field)
-            setattr(instance, field.name, value)
+        for attname, factory in self.get_model_plan(model):
+            setattr(instance, attname, factory())
             
         return instance
 
     def handle_many_to_many_relations(self, model: Type[models.Model]) -> None:
         """Handle M2M relationships after initial object creation."""
-        for field in model._meta.many_to_many:
-            related_model = field.remote_field.model
-            related_objects = self.created_objects.get(
-                f"{related_model._meta.app_label}.{related_model._meta.model_name}", []
-            )
-            
-            if not related_objects:
-                continue
+        pks = self.created_pks.get(self.get_label(model), ())
+        if not pks:
+            return
+
+        rng = np.random.default_rng()
+        # All relations of the model are committed together
+        with self.bulk_transaction():
+            for field in model._meta.many_to_many:
+                related_pks = self.created_pks.get(
+                    self.get_label(field.remote_field.model), ()
+                )
                 
-            for obj in self.created_objects.get(
-                f"{model._meta.app_label}.{model._meta.model_name}", []
-            ):
-                num_relations = random.randint(1, min(5, len(related_objects)))
-                related = random.sample(related_objects, num_relations)
-                getattr(obj, field.name).set(related)
\ No newline at end of file
+                if not related_pks:
+                    continue
+
+                # Fill the intermediate table directly instead of calling
+                # .set() for every object (SELECT + DELETE + INSERT each time)
+                through = field.remote_field.through
+                src_col = f"{field.m2m_field_name()}_id"
+                tgt_col = f"{field.m2m_reverse_field_name()}_id"
+                # Draw the number of relations and the related indexes
+                # (not pks, so any pk type is supported) for all objects
+                # at once. The positions of the max_k smallest random keys
+                # in a row are distinct indexes for that object.
+                max_k = min(5, len(related_pks))
+                num_relations = rng.integers(1, max_k + 1, size=len(pks))
+                indexes = rng.random((len(pks), len(related_pks))).argpartition(
+                    max_k - 1, axis=1
+                )[:, :max_k]
+                rows = [
+                    through(**{src_col: pk, tgt_col: related_pks[i]})
+                    for pk, k, row in zip(pks, num_relations.tolist(), indexes.tolist())
+                    for i in row[:k]
+                ]
+
+                through.objects.bulk_create(
+                    rows, batch_size=5000, ignore_conflicts=True
+                )
+
+
+def generate_model_data(label: str, dependencies: Dict[str, bool],
+                        created_pks: Dict[str, List[Any]],
+                        empty_models: set) -> Dict[str, Any]:
+    """
+    Generate data for one model in a worker process.
+    Returns the resulting state for the parent command to merge.
+    """
+    if not apps.ready:
+        django.setup()
+    command = Command()
+    command.created_pks = created_pks
+    command._empty_models = set(empty_models)
+    model = apps.get_model(label)
+    command._dependencies[model] = {
+        apps.get_model(dependency): required
+        for dependency, required in dependencies.items()
+    }
+    command.generate_data_for_model(model)
+    return {
+        'created_objects': command.created_objects.get(label),
+        'processed': label in command.processed_models,
+        'empty': label in command._empty_models,
+        'skipped': command.skipped_models,
+    }
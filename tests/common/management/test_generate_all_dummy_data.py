@@ -0,0 +1,261 @@
+from concurrent.futures import Future
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group
+from django.contrib.auth.models import User
+from django.core.management.base import OutputWrapper
+from django.test import SimpleTestCase
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+
+from common.management.commands.generate_all_dummy_data import BULK_INSERT_MAX_PARAMS
+from common.management.commands.generate_all_dummy_data import Command
+from common.management.commands.generate_all_dummy_data import RAW_INSERT_MIN_FIELDS
+from common.management.commands.generate_all_dummy_data import generate_model_data
+from common.models import Department
+from crm.models import Company
+from crm.models import Contact
+from crm.models import Deal
+from crm.models import Lead
+from crm.models import Payment
+from crm.models import Request
+from crm.models import Stage
+from crm.models import Tag
+
+# manage.py test tests.common.management.test_generate_all_dummy_data --noinput
+
+
+class TestGenerateAllDummyData(SimpleTestCase):
+
+    def setUp(self):
+        print(" Run Test Method:", self._testMethodName)
+        self.command = Command()
+
+    def test_sort_models_by_dependencies(self):
+        sorted_models = self.command.sort_models_by_dependencies(
+            [Deal, Contact, Company]
+        )
+        self.assertEqual(len(sorted_models), 3)
+        self.assertLess(sorted_models.index(Company), sorted_models.index(Contact))
+        self.assertLess(sorted_models.index(Contact), sorted_models.index(Deal))
+
+    def test_sort_models_with_cycle(self):
+        # Deal and Request refer to each other through nullable FKs,
+        # Payment requires Deal
+        sorted_models = self.command.sort_models_by_dependencies(
+            [Payment, Request, Deal]
+        )
+        self.assertCountEqual(sorted_models, [Payment, Request, Deal])
+        self.assertLess(sorted_models.index(Deal), sorted_models.index(Payment))
+        self.assertEqual(
+            [model for level in self.command._levels for model in level],
+            sorted_models
+        )
+
+    def test_generate_data_in_workers(self):
+        out = StringIO()
+        self.command.stdout = OutputWrapper(out)
+        tags = [Tag(pk=1), Tag(pk=2)]
+
+        class FakeExecutor:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+            def submit(self, fn, label, *args):
+                future = Future()
+                if label == 'crm.company':
+                    future.set_exception(RuntimeError('worker crashed'))
+                else:
+                    future.set_result({
+                        'created_objects': tags,
+                        'processed': True,
+                        'empty': False,
+                        'skipped': set(),
+                    })
+                return future
+
+        module = 'common.management.commands.generate_all_dummy_data'
+        with patch(f'{module}.ProcessPoolExecutor', FakeExecutor), \
+                patch(f'{module}.connections'):
+            self.command.generate_data_in_workers([Tag, Company], 2)
+
+        self.assertEqual(self.command.created_objects['crm.tag'], tags)
+        self.assertEqual(self.command.created_pks['crm.tag'], [1, 2])
+        self.assertIn('crm.tag', self.command.processed_models)
+        self.assertNotIn('crm.company', self.command.processed_models)
+        self.assertIn('crm.company', self.command.skipped_models)
+        self.assertIn('crm.company', self.command._empty_models)
+        self.assertIn('Error processing crm.Company: worker crashed', out.getvalue())
+
+    def test_get_label(self):
+        self.assertEqual(self.command.get_label(Company), "crm.company")
+        self.assertIs(self.command.get_label(Company), self.command._label[Company])
+
+    def test_choices_field_value(self):
+        for model, field_name in ((Lead, 'sex'), (Contact, 'sex')):
+            field = model._meta.get_field(field_name)
+            factory = self.command.get_value_factory(field)
+            choices = [choice[0] for choice in field.flatchoices]
+            for _ in range(20):
+                self.assertIn(factory(), choices)
+
+    def test_get_batch_size(self):
+        batch_size = self.command.get_batch_size(Contact)
+        self.assertGreaterEqual(batch_size, 1)
+        self.assertLessEqual(
+            batch_size * len(Contact._meta.fields), BULK_INSERT_MAX_PARAMS
+        )
+
+
+class TestCreateBaseAuthModels(TestCase):
+    fixtures = ('groups.json',)
+
+    def setUp(self):
+        print(" Run Test Method:", self._testMethodName)
+
+    def test_create_base_auth_models(self):
+        command = Command()
+        command.create_base_auth_models()
+        command.create_base_auth_models()
+        self.assertEqual(
+            Group.objects.filter(
+                name__in=('managers', 'operators', 'superoperators')
+            ).count(),
+            3
+        )
+        self.assertEqual(User.objects.filter(is_superuser=True).count(), 1)
+
+
+class TestCreateBaseAuthModelsWithoutFixtures(TestCase):
+
+    def setUp(self):
+        print(" Run Test Method:", self._testMethodName)
+
+    def test_groups_survive_superuser_failure(self):
+        # Without the "co-workers" group the superuser can't be created
+        with self.assertLogs(
+            'common.management.commands.generate_all_dummy_data', 'ERROR'
+        ):
+            Command().create_base_auth_models()
+        self.assertEqual(
+            Group.objects.filter(
+                name__in=('managers', 'operators', 'superoperators')
+            ).count(),
+            3
+        )
+        self.assertFalse(User.objects.filter(is_superuser=True).exists())
+
+
+class TestGenerateData(TestCase):
+
+    def setUp(self):
+        print(" Run Test Method:", self._testMethodName)
+        self.command = Command()
+
+    def test_model_plan_skips_auto_pk(self):
+        plan = self.command.get_model_plan(Contact)
+        attnames = [attname for attname, _ in plan]
+        self.assertNotIn('id', attnames)
+        self.assertIn('company_id', attnames)
+        self.assertIs(plan, self.command.get_model_plan(Contact))
+
+    def test_generate_data_and_m2m_relations(self):
+        self.command.generate_data_for_model(Tag)
+        self.command.generate_data_for_model(Company)
+        tag_pks = self.command.created_pks['crm.tag']
+        company_pks = self.command.created_pks['crm.company']
+        self.assertEqual(len(tag_pks), 100)
+        self.assertEqual(Tag.objects.count(), 100)
+        self.assertEqual(len(company_pks), Company.objects.count())
+        self.assertEqual(set(tag_pks), set(Tag.objects.values_list('pk', flat=True)))
+
+        self.command.handle_many_to_many_relations(Company)
+        through = Company.tags.through
+        for company_pk in company_pks:
+            related = list(
+                through.objects.filter(company_id=company_pk).values_list(
+                    'tag_id', flat=True
+                )
+            )
+            self.assertTrue(1 <= len(related) <= 5)
+            self.assertEqual(len(related), len(set(related)))
+            self.assertTrue(set(related).issubset(tag_pks))
+
+    def test_generate_model_data(self):
+        result = generate_model_data('crm.tag', {}, {}, set())
+        self.assertEqual(len(result['created_objects']), 100)
+        self.assertTrue(result['processed'])
+        self.assertFalse(result['empty'])
+        self.assertEqual(result['skipped'], set())
+
+    def test_generate_model_data_without_required_dependency(self):
+        result = generate_model_data(
+            'crm.stage', {'auth.group': True}, {}, {'auth.group'}
+        )
+        self.assertIsNone(result['created_objects'])
+        self.assertFalse(result['processed'])
+        self.assertTrue(result['empty'])
+        self.assertEqual(result['skipped'], {'crm.stage (no auth.group records)'})
+        self.assertFalse(Stage.objects.exists())
+
+    def test_model_without_rows_is_skipped(self):
+        # Stage.department is required, and there are no groups
+        self.command.generate_data_for_model(Stage)
+        self.assertEqual(Stage.objects.count(), 0)
+        self.assertNotIn('crm.stage', self.command.processed_models)
+        self.assertTrue(any(
+            skipped.startswith('crm.stage') for skipped in self.command.skipped_models
+        ))
+        self.assertIn('crm.stage', self.command._empty_models)
+
+    def test_multi_table_model_skips_conflicting_rows(self):
+        plan = self.command.get_model_plan(Department)
+        # Group.name is unique, the second "Duplicate" row conflicts
+        names = iter(['Duplicate'] * 2 + [f'Department {i}' for i in range(98)])
+        self.command._plan_cache[Department] = [
+            (attname, (lambda: next(names)) if attname == 'name' else factory)
+            for attname, factory in plan
+        ]
+        self.command.generate_data_for_model(Department)
+        self.assertIn('common.department', self.command.processed_models)
+        self.assertEqual(len(self.command.created_pks['common.department']), 99)
+        self.assertEqual(Department.objects.count(), 99)
+
+    def test_bulk_insert_raw(self):
+        self.assertGreaterEqual(len(Deal._meta.fields), RAW_INSERT_MIN_FIELDS)
+        objs = [self.command.create_model_instance(Deal) for _ in range(2)]
+        fields = [
+            field for field in Deal._meta.concrete_fields
+            if not isinstance(field, models.AutoField)
+        ]
+        qn = connection.ops.quote_name
+        columns = ', '.join(qn(field.column) for field in fields)
+
+        with patch(
+            'common.management.commands.generate_all_dummy_data.execute_values',
+            return_value=[(11,), (12,)]
+        ) as execute_values:
+            pks = Command.bulk_insert_raw(Deal, objs)
+
+        self.assertEqual(pks, [11, 12])
+        execute_values.assert_called_once()
+        _, sql, rows = execute_values.call_args.args
+        self.assertEqual(
+            sql,
+            f'INSERT INTO {qn("crm_deal")} ({columns}) VALUES %s '
+            f'ON CONFLICT DO NOTHING RETURNING {qn("id")}'
+        )
+        self.assertEqual(execute_values.call_args.kwargs, {'page_size': 1000, 'fetch': True})
+        self.assertEqual(len(rows), 2)
+        name_index = [field.name for field in fields].index('name')
+        for obj, row in zip(objs, rows):
+            self.assertEqual(len(row), len(fields))
+            self.assertEqual(row[name_index], obj.name)